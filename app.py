@@ -25,6 +25,14 @@ first_major = None  # To store the major of the first student who taps their tag
 first_stage = None  # To store the stage of the first student
 first_study = None  # To store the study of the first student
 first_group = None  # To store the group of the first student
+disk_conn = None  # Connection to the on-disk database while session mode is active
+flush_job = None  # Pending root.after() id for the next periodic flush
+flushed_changes = 0  # conn.total_changes at the time of the last flush
+flushed_attendance_id = 0  # Highest attendance.id already written to disk
+flushed_student_rowid = 0  # Highest students rowid already written to disk
+session_reset = False  # Attendance was reset since the last flush
+flush_failed = False  # The last flush failed and the user has been warned
+SESSION_FLUSH_INTERVAL_MS = 30000  # How often session mode writes changes back to disk
 
 def create_db_connection(db_file):
     """Create a connection to the SQLite database."""
@@ -36,6 +44,122 @@ def create_db_connection(db_file):
         messagebox.showerror("Database Error", str(e))
         return False
 
+def start_session():
+    """Load the active database into memory so taps never touch the disk file."""
+    global conn, disk_conn, flushed_changes, flushed_attendance_id, flushed_student_rowid, session_reset
+    if not conn:
+        messagebox.showerror("Error", "No database loaded.")
+        return
+    if disk_conn:
+        return  # Session mode is already active
+    memory_conn = sqlite3.connect(":memory:")
+    try:
+        conn.backup(memory_conn)
+    except sqlite3.Error as e:
+        memory_conn.close()
+        messagebox.showerror("Database Error", f"Failed to start session mode: {e}")
+        return
+    disk_conn = conn
+    conn = memory_conn
+    cursor = conn.cursor()
+    cursor.execute("SELECT COALESCE(MAX(id), 0) FROM attendance")
+    flushed_attendance_id = cursor.fetchone()[0]
+    cursor.execute("SELECT COALESCE(MAX(rowid), 0) FROM students")
+    flushed_student_rowid = cursor.fetchone()[0]
+    flushed_changes = conn.total_changes
+    session_reset = False
+    schedule_flush()
+    btn_session.configure(text="⏹ End Session Mode", command=end_session)
+    session_status.configure(text="Session mode: ON (in memory)", fg=ACCENT_COLOR)
+
+def schedule_flush():
+    """Schedule the next periodic flush of the in-memory database."""
+    global flush_job
+    flush_job = root.after(SESSION_FLUSH_INTERVAL_MS, periodic_flush)
+
+def periodic_flush():
+    """Flush session changes to disk and schedule the next flush."""
+    flush_session_to_disk()
+    if disk_conn:
+        schedule_flush()
+
+def flush_session_to_disk():
+    """Write the rows added or removed since the last flush to the on-disk file."""
+    global flushed_changes, flushed_attendance_id, flushed_student_rowid, session_reset, flush_failed
+    if not disk_conn:
+        return True
+    if conn.total_changes == flushed_changes:
+        return True  # Nothing changed since the last flush
+    cursor = conn.cursor()
+    # Attendance ids use AUTOINCREMENT and students are never deleted,
+    # so everything past the last flushed id/rowid is new
+    cursor.execute("""
+        SELECT id, student_id, name, major, stage, study, group_name, timestamp, attended
+        FROM attendance WHERE id > ? ORDER BY id
+    """, (flushed_attendance_id,))
+    new_attendance = cursor.fetchall()
+    cursor.execute("""
+        SELECT rowid, student_id, name, major, stage, study, group_name
+        FROM students WHERE rowid > ? ORDER BY rowid
+    """, (flushed_student_rowid,))
+    new_students = cursor.fetchall()
+    try:
+        disk_cursor = disk_conn.cursor()
+        if session_reset:
+            disk_cursor.execute("DELETE FROM attendance")
+        disk_cursor.executemany("""
+            INSERT INTO students (student_id, name, major, stage, study, group_name)
+            VALUES (?, ?, ?, ?, ?, ?)
+        """, [row[1:] for row in new_students])
+        disk_cursor.executemany("""
+            INSERT INTO attendance (id, student_id, name, major, stage, study, group_name, timestamp, attended)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+        """, new_attendance)
+        disk_conn.commit()
+    except sqlite3.Error as e:
+        disk_conn.rollback()
+        if not flush_failed:
+            # Warn once, then keep the warning visible without blocking taps
+            flush_failed = True
+            messagebox.showerror("Database Error", f"Failed to save session to disk: {e}\nWill keep retrying.")
+        session_status.configure(text="Session mode: ON - NOT SAVED TO DISK, retrying", fg=WARNING_COLOR)
+        return False
+    if new_attendance:
+        flushed_attendance_id = new_attendance[-1][0]
+    if new_students:
+        flushed_student_rowid = new_students[-1][0]
+    flushed_changes = conn.total_changes
+    session_reset = False
+    if flush_failed:
+        flush_failed = False
+        session_status.configure(text="Session mode: ON (in memory)", fg=ACCENT_COLOR)
+    return True
+
+def end_session():
+    """Flush the in-memory database to disk and switch back to the file."""
+    global conn, disk_conn, flush_job
+    if not disk_conn:
+        return
+    if flush_job:
+        root.after_cancel(flush_job)
+        flush_job = None
+    if not flush_session_to_disk():
+        schedule_flush()  # Keep the session alive so no taps are lost
+        return
+    conn.close()
+    conn = disk_conn
+    disk_conn = None
+    btn_session.configure(text="⚡ Start Session Mode", command=start_session)
+    session_status.configure(text="Session mode: OFF", fg="#666")
+
+def on_close():
+    """Make sure session changes reach the disk before the window closes."""
+    end_session()
+    if disk_conn:
+        if not messagebox.askyesno("Unsaved Session", "The session could not be saved to disk. Quit anyway?"):
+            return
+    root.destroy()
+
 def initialize_db():
     """Initialize the database with the required tables."""
     if conn:
@@ -74,6 +198,9 @@ def load_db_from_dropdown(event=None):
         messagebox.showwarning("Input Error", "No database selected.")
         return
     db_file = os.path.join("Students Databases", selected_db)
+    end_session()  # Save any in-memory session before switching databases
+    if disk_conn:
+        return  # Session could not be saved, stay on the current database
     if create_db_connection(db_file):
         current_db = db_file
         initialize_db()
@@ -112,6 +239,9 @@ def create_db():
         filetypes=[("SQLite Database", "*.db")]
     )
     if db_file:
+        end_session()  # Save any in-memory session before switching databases
+        if disk_conn:
+            return  # Session could not be saved, stay on the current database
         if create_db_connection(db_file):
             current_db = db_file
             initialize_db()
@@ -326,7 +456,7 @@ def export_attendance():
 
 def reset_attendance():
     """Reset all attendance data and clear the filters."""
-    global first_major, first_stage, first_study, first_group
+    global first_major, first_stage, first_study, first_group, session_reset
     if not conn:
         messagebox.showerror("Error", "No database loaded.")
         return
@@ -334,6 +464,8 @@ def reset_attendance():
     cursor = conn.cursor()
     cursor.execute("DELETE FROM attendance")
     conn.commit()
+    if disk_conn:
+        session_reset = True  # The next flush must clear the disk copy too
     # Clear the dashboard
     dashboard_tree.delete(*dashboard_tree.get_children())
     # Reset the filters
@@ -618,7 +750,15 @@ btn_export.pack(side=tk.LEFT, padx=(0, 10))
 
 btn_reset = ttk.Button(attendance_buttons, text="🔄 Reset Attendance", 
                       command=reset_attendance, style="Danger.TButton")
-btn_reset.pack(side=tk.LEFT)
+btn_reset.pack(side=tk.LEFT, padx=(0, 10))
+
+btn_session = ttk.Button(attendance_buttons, text="⚡ Start Session Mode", 
+                        command=start_session)
+btn_session.pack(side=tk.LEFT)
+
+session_status = tk.Label(attendance_frame, text="Session mode: OFF", 
+                         font=("Segoe UI", 10, "italic"), fg="#666", bg=SURFACE_COLOR)
+session_status.pack(anchor="w")
 
 # Attendance dashboard
 dashboard_frame = tk.Frame(attendance_frame, bg=SURFACE_COLOR)
@@ -664,4 +804,5 @@ dashboard_tree.configure(yscrollcommand=scrollbar.set)
 scrollbar.pack(side=tk.RIGHT, fill="y")
 
 # Run the application
+root.protocol("WM_DELETE_WINDOW", on_close)
 root.mainloop()
\ No newline at end of file
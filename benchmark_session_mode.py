@@ -0,0 +1,218 @@
+"""Compare per-tap latency of the normal file-backed mode against session mode.
+
+Runs the same queries record_attendance() issues for every tap against a
+temporary database file, once directly on the file and once on an in-memory
+copy loaded through the backup API (as start_session() does). In session
+mode the incremental flush from flush_session_to_disk() runs on the same
+schedule as in the app, and its cost is added to the tap that would have
+waited behind it on the UI thread.
+
+Usage:
+    python benchmark_session_mode.py [--students N] [--rows N] [--tap-interval S] [--dir PATH]
+
+Use --dir to place the test database on the storage you want to measure,
+e.g. a network share or USB drive, and --rows to give it a realistic amount
+of attendance history.
+"""
+import argparse
+import math
+import os
+import sqlite3
+import statistics
+import tempfile
+import time
+from datetime import datetime
+
+SESSION_FLUSH_INTERVAL = 30  # Seconds between flushes, same as SESSION_FLUSH_INTERVAL_MS in app.py
+
+
+def positive_int(value):
+    """argparse type for integers of at least 1."""
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError("must be at least 1")
+    return number
+
+
+def non_negative_int(value):
+    """argparse type for integers of at least 0."""
+    number = int(value)
+    if number < 0:
+        raise argparse.ArgumentTypeError("must not be negative")
+    return number
+
+
+def positive_float(value):
+    """argparse type for numbers greater than 0."""
+    number = float(value)
+    if number <= 0:
+        raise argparse.ArgumentTypeError("must be greater than 0")
+    return number
+
+
+def create_test_db(db_file, student_count, history_rows):
+    """Create a database with the app's schema, students and past attendance."""
+    db = sqlite3.connect(db_file)
+    db.execute("""
+        CREATE TABLE IF NOT EXISTS students (
+            student_id TEXT PRIMARY KEY,
+            name TEXT NOT NULL,
+            major TEXT NOT NULL,
+            stage TEXT NOT NULL,
+            study TEXT NOT NULL,
+            group_name TEXT NOT NULL
+        )
+    """)
+    db.execute("""
+        CREATE TABLE IF NOT EXISTS attendance (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            student_id TEXT,
+            name TEXT,
+            major TEXT,
+            stage TEXT,
+            study TEXT,
+            group_name TEXT,
+            timestamp TEXT,
+            attended INTEGER,
+            FOREIGN KEY(student_id) REFERENCES students(student_id)
+        )
+    """)
+    db.executemany("""
+        INSERT INTO students (student_id, name, major, stage, study, group_name)
+        VALUES (?, ?, ?, ?, ?, ?)
+    """, [(f"NFC{i:05d}", f"Student {i}", "Computer Science", "3", "Morning", "A")
+          for i in range(student_count)])
+    # Earlier lectures, dated in the past so they never count as attended today
+    db.executemany("""
+        INSERT INTO attendance (student_id, name, major, stage, study, group_name, timestamp, attended)
+        VALUES (?, ?, ?, ?, ?, ?, ?, 1)
+    """, ((f"NFC{i % student_count:05d}", f"Student {i % student_count}", "Computer Science",
+           "3", "Morning", "A", f"2000-01-{1 + i // student_count % 28:02d} 09:00:00")
+          for i in range(history_rows)))
+    db.commit()
+    db.close()
+
+
+def tap(conn, nfc_id):
+    """Run the database work of a single tap, mirroring record_attendance()."""
+    cursor = conn.cursor()
+    cursor.execute("SELECT * FROM students WHERE student_id=?", (nfc_id,))
+    student = cursor.fetchone()
+    today = datetime.now().strftime("%Y-%m-%d")
+    cursor.execute("""
+        SELECT * FROM attendance
+        WHERE student_id=? AND DATE(timestamp)=?
+    """, (nfc_id, today))
+    if cursor.fetchone():
+        return
+    timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    cursor.execute("""
+        INSERT INTO attendance (student_id, name, major, stage, study, group_name, timestamp, attended)
+        VALUES (?, ?, ?, ?, ?, ?, ?, 1)
+    """, (student[0], student[1], student[2], student[3], student[4], student[5], timestamp))
+    conn.commit()
+
+
+def flush(memory_conn, disk_conn, state):
+    """Write attendance rows added since the last flush, mirroring flush_session_to_disk()."""
+    cursor = memory_conn.cursor()
+    cursor.execute("""
+        SELECT id, student_id, name, major, stage, study, group_name, timestamp, attended
+        FROM attendance WHERE id > ? ORDER BY id
+    """, (state["attendance_id"],))
+    new_attendance = cursor.fetchall()
+    disk_conn.cursor().executemany("""
+        INSERT INTO attendance (id, student_id, name, major, stage, study, group_name, timestamp, attended)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+    """, new_attendance)
+    disk_conn.commit()
+    if new_attendance:
+        state["attendance_id"] = new_attendance[-1][0]
+
+
+def measure(conn, student_count, tap_interval, flush_conns=None):
+    """Tap every student once and return per-tap latencies and flush times in milliseconds.
+
+    Taps are spaced tap_interval seconds apart on a simulated clock. When
+    flush_conns is given, a flush runs every SESSION_FLUSH_INTERVAL seconds
+    and its time is added to the next tap, which would be queued behind it.
+    """
+    latencies = []
+    flush_times = []
+    state = None
+    if flush_conns:
+        cursor = conn.cursor()
+        cursor.execute("SELECT COALESCE(MAX(id), 0) FROM attendance")
+        state = {"attendance_id": cursor.fetchone()[0]}
+    next_flush = SESSION_FLUSH_INTERVAL
+    for i in range(student_count):
+        waited = 0.0
+        if flush_conns and i * tap_interval >= next_flush:
+            start = time.perf_counter()
+            flush(conn, flush_conns, state)
+            waited = (time.perf_counter() - start) * 1000
+            flush_times.append(waited)
+            next_flush += SESSION_FLUSH_INTERVAL
+        start = time.perf_counter()
+        tap(conn, f"NFC{i:05d}")
+        latencies.append(waited + (time.perf_counter() - start) * 1000)
+    if flush_conns:
+        # Session end flush
+        start = time.perf_counter()
+        flush(conn, flush_conns, state)
+        flush_times.append((time.perf_counter() - start) * 1000)
+    return latencies, flush_times
+
+
+def report(label, latencies):
+    """Print a one-line latency summary."""
+    ordered = sorted(latencies)
+    p95 = ordered[math.ceil(len(ordered) * 0.95) - 1]  # Nearest-rank percentile
+    print(f"{label:<14} mean={statistics.mean(latencies):8.3f} ms  "
+          f"median={statistics.median(latencies):8.3f} ms  "
+          f"p95={p95:8.3f} ms  max={ordered[-1]:8.3f} ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--students", type=positive_int, default=200, help="number of taps to simulate")
+    parser.add_argument("--rows", type=non_negative_int, default=100000,
+                        help="attendance history rows already in the database")
+    parser.add_argument("--tap-interval", type=positive_float, default=2.0,
+                        help="simulated seconds between taps")
+    parser.add_argument("--dir", default=None, help="directory for the test database")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory(dir=args.dir) as tmp:
+        # File-backed mode: every tap commits straight to the disk file
+        file_db = os.path.join(tmp, "file_mode.db")
+        create_test_db(file_db, args.students, args.rows)
+        db_size = os.path.getsize(file_db) / (1024 * 1024)
+        conn = sqlite3.connect(file_db)
+        file_latencies, _ = measure(conn, args.students, args.tap_interval)
+        conn.close()
+
+        # Session mode: taps go to memory, new rows are flushed on a timer
+        session_db = os.path.join(tmp, "session_mode.db")
+        create_test_db(session_db, args.students, args.rows)
+        disk_conn = sqlite3.connect(session_db)
+        start = time.perf_counter()
+        memory_conn = sqlite3.connect(":memory:")
+        disk_conn.backup(memory_conn)
+        load_ms = (time.perf_counter() - start) * 1000
+        session_latencies, flush_times = measure(memory_conn, args.students, args.tap_interval, disk_conn)
+        memory_conn.close()
+        saved = disk_conn.execute("SELECT COUNT(*) FROM attendance").fetchone()[0]
+        disk_conn.close()
+
+    print(f"Simulated {args.students} taps, {args.tap_interval:g} s apart, "
+          f"on a {db_size:.1f} MB database ({args.rows} history rows)")
+    report("File mode", file_latencies)
+    report("Session mode", session_latencies)
+    print(f"Session mode includes {len(flush_times)} flushes every {SESSION_FLUSH_INTERVAL} s: "
+          f"mean={statistics.mean(flush_times):.3f} ms  max={max(flush_times):.3f} ms")
+    print(f"Session load: {load_ms:.3f} ms ({saved} attendance rows on disk after the session)")
+
+
+if __name__ == "__main__":
+    main()